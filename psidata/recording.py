@@ -2,10 +2,17 @@ import logging
 log = logging.getLogger(__name__)
 
 import functools
+import io
+import os
 from pathlib import Path
 import yaml
 import zipfile
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 import numpy as np
 import pandas as pd
 
@@ -23,6 +30,10 @@ except ImportError:
 
 UNSET = object()
 
+# Members of a zip file smaller than this (in bytes) are read in a single call
+# rather than streamed.
+ZIP_READ_THRESHOLD = 64 * 2**20
+
 
 class Recording:
     '''
@@ -84,7 +95,8 @@ class Recording:
         self._store = store_class(self.base_path, self._ttable_indices)
 
     def get_parameters(self):
-        preferences = yaml.safe_load(self._store._get_text_stream('initial.preferences'))
+        with self._store._get_text_stream('initial.preferences') as stream:
+            preferences = yaml.load(stream, Loader=SafeLoader)
         expressions = {}
         for context_items in preferences['context']['parameters'].values():
             for name, setting in context_items.items():
@@ -229,11 +241,32 @@ class DirStore(BaseStore):
         return path.open()
 
     def _refresh_names(self):
-        bp = self.base_path
-        self.carray_names = {d.parent.stem for d in bp.glob('*/meta')}
-        self.ctable_names = {d.parent.parent.stem for d in bp.glob('*/*/meta')}
-        self.ttable_names = {d.stem for d in bp.glob('*.csv')}
-        self.zarr_names = {d.stem for d in bp.glob('*.zarr')}
+        self.carray_names = set()
+        self.ctable_names = set()
+        self.ttable_names = set()
+        self.zarr_names = set()
+
+        # Walk the folder once with os.scandir rather than globbing it once
+        # per pattern. This lets us use the file type cached in each DirEntry
+        # so that the only stat calls are the check for bcolz metadata in each
+        # subfolder of a subfolder (i.e., the columns of a ctable).
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                stem, suffix = os.path.splitext(entry.name)
+                if suffix == '.csv':
+                    self.ttable_names.add(stem)
+                elif suffix == '.zarr':
+                    self.zarr_names.add(stem)
+                if not entry.is_dir():
+                    continue
+                with os.scandir(entry.path) as children:
+                    for child in children:
+                        if child.name == 'meta':
+                            self.carray_names.add(stem)
+                        elif stem in self.ctable_names or not child.is_dir():
+                            continue
+                        elif os.path.exists(os.path.join(child.path, 'meta')):
+                            self.ctable_names.add(stem)
 
 
 class ZipStore(BaseStore):
@@ -242,6 +275,7 @@ class ZipStore(BaseStore):
         self.base_path = Path(base_path)
         self._ttable_indices = ttable_indices
         self.zip_fh = zipfile.ZipFile(base_path)
+        self._zarr_store = None
         self._refresh_names()
 
     def _refresh_names(self):
@@ -258,12 +292,21 @@ class ZipStore(BaseStore):
                 raise ValueError('ZipRecording does not support bcolz')
 
     def _get_text_stream(self, name):
-        return self.zip_fh.open(name)
+        # Streaming from the zip file goes through several layers of buffering
+        # and locking on every read, which is slow for the small tables and
+        # preference files we typically load. Read these in one call instead.
+        if self.zip_fh.getinfo(name).file_size > ZIP_READ_THRESHOLD:
+            return self.zip_fh.open(name)
+        return io.BytesIO(self.zip_fh.read(name))
 
     @functools.lru_cache()
     def _load_zarr_signal(self, name):
-        from .zarr_tools import ZarrSignal
-        return ZarrSignal.from_zip(self.base_path, name)
+        from .zarr_tools import ZarrSignal, open_zip_store
+        # Share one store across all arrays in this recording so that the
+        # central directory of the zip file is only parsed once.
+        if self._zarr_store is None:
+            self._zarr_store = open_zip_store(self.base_path)
+        return ZarrSignal.from_zip(self.base_path, name, self._zarr_store)
 
 
 class NestedZipStore(ZipStore):
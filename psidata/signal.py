@@ -130,7 +130,7 @@ class Signal:
         else:
             index = pd.Index(times, name='t0')
 
-        values = []
+        values = None
         n = len(indices)
         for j, i in enumerate(indices):
             # This hack is in-place to handle legacy data that was stored in 1D
@@ -141,25 +141,25 @@ class Signal:
                 v = data[i:i+samples]
             else:
                 v = data[channel, i:i+samples]
-            pad_n = samples - v.shape[-1]
-            if pad_n:
-                if v.ndim == 2:
-                    padding = [(0, 0), (0, pad_n)]
-                elif v.ndim == 1:
-                    padding = (0, pad_n)
-                else:
-                    raise ValueError('Unsupported dimensionality for signal')
-                v = np.pad(v, padding, mode='constant', constant_values=np.nan)
-            values.append(v[np.newaxis])
+            if values is None:
+                # Allocate the output array once we know the shape of a segment
+                # and copy each segment into it. Building a list of segments
+                # and concatenating them requires twice the memory. Segments
+                # that run past the end of the data are left padded with NaN.
+                #
+                # We need to ensure that data is cast to double since there are
+                # some rare edge-cases in which precision is lost when
+                # filtering and downsampling.
+                shape = (n,) + v.shape[:-1] + (samples,)
+                values = np.full(shape, np.nan, dtype='double')
+            values[j, ..., :v.shape[-1]] = v
             if ((j+1) % cb_n) == 0:
                 cb((j+1)/n)
 
-        cb(1)
+        if values is None:
+            raise ValueError('No segments to load')
 
-        # We need to ensure that data is cast to double since there are some
-        # rare edge-cases in which precision is lost when filtering and
-        # downsampling.
-        values = np.concatenate(values, axis=0).astype('double')
+        cb(1)
 
         if detrend is not None:
             values = signal.detrend(values, axis=-1, type=detrend)
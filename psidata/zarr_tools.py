@@ -1,10 +1,17 @@
 import logging
 log = logging.getLogger(__name__)
 
+from concurrent.futures import ThreadPoolExecutor
 import functools
 
 import zarr
 
+try:
+    from zarr.storage import DirectoryStore, LRUStoreCache
+except ImportError:
+    # Removed in zarr 3.
+    DirectoryStore = LRUStoreCache = None
+
 from .signal import Signal
 
 
@@ -12,34 +19,100 @@ from .signal import Signal
 MAXSIZE = 1024
 
 
+def open_zip_store(path):
+    '''
+    Return read-only store for zip file
+
+    Opening a zip file parses its entire central directory. Since a recording
+    typically contains several arrays, the store can be opened once and shared
+    across all arrays in the same zip file (see `ZarrSignal.from_zip`).
+    '''
+    return zarr.storage.ZipStore(str(path), mode='r')
+
+
+def add_chunk_cache(store, cache_size):
+    '''
+    Wrap store in a cache that holds up to cache_size bytes of chunks
+
+    Chunks are cached in their compressed form. If store is a string, it is
+    treated as the path to a directory store. Returns the store unchanged if
+    cache_size is None.
+    '''
+    if cache_size is None:
+        return store
+    if LRUStoreCache is None:
+        raise ValueError('Chunk cache requires zarr < 3')
+    if isinstance(store, str):
+        store = DirectoryStore(store)
+    return LRUStoreCache(store, max_size=cache_size)
+
+
+@functools.lru_cache()
+def _get_prefetch_executor():
+    # Shared by all signals so that prefetching does not leave a worker thread
+    # behind for each signal.
+    return ThreadPoolExecutor(max_workers=1,
+                              thread_name_prefix='psidata-prefetch')
+
+
 class ZarrSignal(Signal):
 
     @classmethod
-    def from_zip(cls, path, name):
-        array = zarr.open(store=str(path), mode='r', path=f'{name}.zarr')
+    def from_zip(cls, path, name, store=None, cache_size=None):
+        if store is None:
+            store = open_zip_store(path)
+        store = add_chunk_cache(store, cache_size)
+        array = zarr.open(store=store, mode='r', path=f'{name}.zarr')
         return cls(array)
 
     @classmethod
-    def from_path(cls, path):
+    def from_path(cls, path, cache_size=None):
         path = path.with_suffix('.zarr')
-        array = zarr.open(store=str(path), mode='r')
+        store = add_chunk_cache(str(path), cache_size)
+        array = zarr.open(store=store, mode='r')
         return cls(array)
 
     def __init__(self, array):
         super().__init__()
         self.array = array
+        # The array is opened read-only, so we can cache the metadata rather
+        # than reading it from the store each time it is accessed.
+        self._fs = array.attrs['fs']
+        self._shape = array.shape
 
     @property
     def fs(self):
-        return self.array.attrs['fs']
+        return self._fs
 
     @property
     def duration(self):
-        return self.array.shape[-1]/self.fs
+        return self._shape[-1]/self._fs
 
     def __getitem__(self, slice):
         return self.array[slice]
 
     @property
     def shape(self):
-        return self.array.shape
+        return self._shape
+
+    def prefetch(self, slice):
+        '''
+        Start loading slice in a background thread
+
+        This is useful when processing the signal in sequential blocks since
+        the next block can be read while the current one is being processed.
+        If the signal was opened with a chunk cache (see `cache_size` in
+        `from_zip` and `from_path`), the chunks spanned by the slice are also
+        cached.
+
+        Parameters
+        ----------
+        slice : slice or tuple of slices
+            Region of the array to load.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Future whose result is the requested data.
+        '''
+        return _get_prefetch_executor().submit(self.array.__getitem__, slice)
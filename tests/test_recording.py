@@ -0,0 +1,60 @@
+import io
+import shutil
+
+import pandas as pd
+
+from psidata import recording
+from psidata.recording import DirStore, Recording
+
+
+def test_dir_store_names(tmp_path):
+    # Only the layout on disk is used to classify entries, so empty
+    # placeholders are sufficient.
+    (tmp_path / 'eeg.zarr').mkdir()
+    (tmp_path / 'trial_log.csv').write_text('a,b\n1,2\n')
+    (tmp_path / 'microphone' / 'meta').mkdir(parents=True)
+    (tmp_path / 'erp_metadata' / 't0' / 'meta').mkdir(parents=True)
+    (tmp_path / 'erp_metadata' / '__rootdirs__').write_text('{}')
+    (tmp_path / 'notes.txt').write_text('')
+    (tmp_path / 'empty').mkdir()
+
+    store = DirStore(tmp_path, {})
+    assert store.zarr_names == {'eeg'}
+    assert store.ttable_names == {'trial_log'}
+    assert store.carray_names == {'microphone'}
+    assert store.ctable_names == {'erp_metadata'}
+
+
+PREFERENCES = '''
+context:
+  parameters:
+    tone:
+      level: {expression: '80'}
+      frequency: {selected: '8000'}
+'''
+
+
+def test_zip_text_streams(tmp_path, monkeypatch):
+    base_path = tmp_path / 'recording'
+    base_path.mkdir()
+    (base_path / 'trial_log.csv').write_text('level,frequency\n80,8000\n60,4000\n')
+    (base_path / 'initial.preferences').write_text(PREFERENCES)
+    zip_path = shutil.make_archive(base_path, 'zip', base_path)
+
+    fh = Recording(zip_path)
+    assert isinstance(fh._store._get_text_stream('trial_log.csv'), io.BytesIO)
+    read_log = fh.trial_log
+    read_parameters = fh.get_parameters()
+
+    # Force all members to be streamed from the zip file instead.
+    monkeypatch.setattr(recording, 'ZIP_READ_THRESHOLD', 0)
+    fh = Recording(zip_path)
+    assert not isinstance(fh._store._get_text_stream('trial_log.csv'), io.BytesIO)
+    stream_log = fh.trial_log
+    stream_parameters = fh.get_parameters()
+
+    expected = pd.DataFrame({'level': [80, 60], 'frequency': [8000, 4000]})
+    pd.testing.assert_frame_equal(read_log, expected)
+    pd.testing.assert_frame_equal(stream_log, expected)
+    assert read_parameters == {'level': '80', 'frequency': '8000'}
+    assert stream_parameters == read_parameters
@@ -0,0 +1,42 @@
+import numpy as np
+
+from psidata.signal import Signal
+
+
+class ArraySignal(Signal):
+
+    def __init__(self, array, fs):
+        super().__init__()
+        self.array = array
+        self.fs = fs
+
+    def __getitem__(self, slice):
+        return self.array[slice]
+
+    @property
+    def shape(self):
+        return self.array.shape
+
+
+def test_get_segments_pads_int_signal():
+    array = np.arange(1000, dtype='int16')
+    signal = ArraySignal(array, fs=100)
+    # The last epoch starts 5 samples before the end of the signal.
+    df = signal.get_segments([0.5, 9.95], 0, 0.1, allow_partial=True)
+    assert df.values.dtype == np.float64
+    np.testing.assert_array_equal(df.values[0], np.arange(50, 60))
+    np.testing.assert_array_equal(df.values[1, :5], np.arange(995, 1000))
+    assert np.isnan(df.values[1, 5:]).all()
+
+
+def test_get_segments_matches_concatenate():
+    rng = np.random.default_rng(0)
+    array = rng.normal(size=(2, 1000))
+    signal = ArraySignal(array, fs=100)
+    times = np.array([0.5, 2, 7.25])
+    df = signal.get_segments(times, -0.01, 0.1, channel=1)
+
+    indices = np.round((times - 0.01) * 100).astype('i')
+    expected = np.concatenate([array[1, i:i+10][np.newaxis] for i in indices])
+    np.testing.assert_array_equal(df.values, expected)
+    np.testing.assert_array_equal(df.index, times)
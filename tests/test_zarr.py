@@ -0,0 +1,82 @@
+import shutil
+
+import numpy as np
+import pytest
+
+zarr = pytest.importorskip('zarr')
+
+from psidata.recording import Recording
+from psidata import zarr_tools
+from psidata.zarr_tools import ZarrSignal
+
+
+@pytest.fixture
+def expected():
+    return np.arange(2000, dtype='double').reshape((2, 1000))
+
+
+@pytest.fixture
+def zarr_path(tmp_path, expected):
+    path = tmp_path / 'recording' / 'eeg.zarr'
+    array = zarr.open(str(path), mode='w', shape=expected.shape,
+                      chunks=(1, 100), dtype=expected.dtype)
+    array[:] = expected
+    array.attrs['fs'] = 100.0
+    return path
+
+
+def test_from_path(zarr_path, expected):
+    signal = ZarrSignal.from_path(zarr_path)
+    assert signal.fs == 100.0
+    assert signal.shape == (2, 1000)
+    assert signal.duration == 10.0
+    np.testing.assert_array_equal(signal[:], expected)
+
+
+def test_from_zip(zarr_path, expected):
+    zip_path = shutil.make_archive(zarr_path.parent, 'zip', zarr_path.parent)
+    signal = ZarrSignal.from_zip(zip_path, 'eeg')
+    np.testing.assert_array_equal(signal[:], expected)
+
+
+def test_zip_recording_shares_store(zarr_path, expected):
+    other = zarr.open(str(zarr_path.with_name('mic.zarr')), mode='w',
+                      shape=(1000,), chunks=(100,), dtype='int16')
+    other[:] = np.arange(1000)
+    other.attrs['fs'] = 50.0
+    zip_path = shutil.make_archive(zarr_path.parent, 'zip', zarr_path.parent)
+
+    recording = Recording(zip_path)
+    np.testing.assert_array_equal(recording.eeg[:], expected)
+    np.testing.assert_array_equal(recording.mic[:], np.arange(1000))
+    assert recording.mic.fs == 50.0
+    assert recording.eeg.array.store is recording.mic.array.store
+
+
+def test_prefetch(zarr_path, expected):
+    signal = ZarrSignal.from_path(zarr_path)
+    future = signal.prefetch(np.s_[1, 150:420])
+    np.testing.assert_array_equal(future.result(), expected[1, 150:420])
+
+
+def test_prefetch_cached(zarr_path, expected):
+    if not hasattr(zarr.storage, 'LRUStoreCache'):
+        pytest.skip('Chunk cache requires zarr < 3')
+    signal = ZarrSignal.from_path(zarr_path, cache_size=2**20)
+    future = signal.prefetch(np.s_[:, :250])
+    np.testing.assert_array_equal(future.result(), expected[:, :250])
+    cache = signal.array.store
+    misses = cache.misses
+    np.testing.assert_array_equal(signal[:, :250], expected[:, :250])
+    assert cache.misses == misses
+
+
+def test_cache_unavailable(zarr_path, monkeypatch):
+    # Simulate zarr 3, which does not provide DirectoryStore or LRUStoreCache.
+    monkeypatch.setattr(zarr_tools, 'DirectoryStore', None)
+    monkeypatch.setattr(zarr_tools, 'LRUStoreCache', None)
+    zip_path = shutil.make_archive(zarr_path.parent, 'zip', zarr_path.parent)
+    with pytest.raises(ValueError):
+        ZarrSignal.from_path(zarr_path, cache_size=2**20)
+    with pytest.raises(ValueError):
+        ZarrSignal.from_zip(zip_path, 'eeg', cache_size=2**20)